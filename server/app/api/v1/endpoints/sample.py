@@ -4,15 +4,20 @@ Sample Domain API 엔드포인트
 샘플 도메인의 REST API 엔드포인트를 정의합니다.
 """
 
+import base64
+import binascii
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from server.app.core.responses import ORJSONResponse, PydanticResponse
 from server.app.core.dependencies import (
+    CurrentUser,
     get_database_session,
     get_optional_current_user,
     get_pagination,
+    get_sample_service,
     PaginationParams,
 )
 from server.app.examples.sample_domain.service import (
@@ -71,7 +76,7 @@ router = APIRouter(
 )
 async def get_sample_list(
     db: AsyncSession = Depends(get_database_session),
-    current_user: Optional[dict] = Depends(get_optional_current_user),
+    current_user: Optional[CurrentUser] = Depends(get_optional_current_user),
 ) -> SampleListResponse:
     """
     샘플 데이터 목록을 조회합니다.
@@ -92,7 +97,7 @@ async def get_sample_list(
     # Service 실행
     result = await service.execute(
         None,
-        user_id=current_user.get("id") if current_user else None
+        user_id=current_user.user_id if current_user else None
     )
 
     # 결과 처리
@@ -112,7 +117,7 @@ async def get_sample_list(
 
 @router.post(
     "/analyze",
-    response_model=SampleAnalysisResponse,
+    responses={200: {"model": SampleAnalysisResponse}},
     status_code=status.HTTP_200_OK,
     summary="데이터 분석 실행",
     description="""
@@ -138,35 +143,38 @@ async def get_sample_list(
 )
 async def analyze_data(
     request: SampleAnalysisRequest,
-    db: AsyncSession = Depends(get_database_session),
-    current_user: Optional[dict] = Depends(get_optional_current_user),
-) -> SampleAnalysisResponse:
+    service: SampleDomainService = Depends(get_sample_service),
+    current_user: Optional[CurrentUser] = Depends(get_optional_current_user),
+) -> Response:
     """
     데이터 분석을 수행합니다.
 
     Args:
         request: 분석 요청 데이터
-        db: 데이터베이스 세션
+        service: 샘플 도메인 서비스 (의존성 주입)
         current_user: 현재 사용자 정보 (선택)
 
     Returns:
-        SampleAnalysisResponse: 분석 결과
+        Response: 분석 결과 (orjson으로 직렬화된 SampleAnalysisResponse)
 
     Raises:
         HTTPException: 요청 실패 시
-    """
-    # 서비스 인스턴스 생성
-    service = SampleDomainService(db)
 
+    NOTE: Response 객체를 직접 반환하여 jsonable_encoder와
+          response_model 재검증을 건너뜁니다. 직렬화는
+          PydanticResponse.create가 워커 스레드에서 수행하고,
+          응답 스키마는 데코레이터의 `responses=`로 문서화됩니다.
+    """
     # 사용자 ID 추출 (있는 경우)
-    user_id = current_user.get("user_id") if current_user else None
+    user_id = current_user.user_id if current_user else None
 
     # 서비스 실행
     result = await service.execute(request, user_id=user_id)
 
     # 결과 처리
     if result.success:
-        return result.data
+        # 직렬화를 워커 스레드로 넘겨 이벤트 루프 블로킹을 방지
+        return await PydanticResponse.create(result.data)
     else:
         # 에러 응답
         raise HTTPException(
@@ -177,7 +185,6 @@ async def analyze_data(
 
 @router.get(
     "/health",
-    response_model=dict,
     status_code=status.HTTP_200_OK,
     summary="헬스체크",
     description="샘플 도메인 API의 상태를 확인합니다.",
@@ -201,7 +208,6 @@ async def health_check() -> dict:
 
 @router.get(
     "/data/{data_id}",
-    response_model=dict,
     status_code=status.HTTP_200_OK,
     summary="데이터 조회",
     description="ID로 샘플 데이터를 조회합니다.",
@@ -209,7 +215,7 @@ async def health_check() -> dict:
 async def get_data(
     data_id: int,
     db: AsyncSession = Depends(get_database_session),
-) -> dict:
+) -> Response:
     """
     데이터를 조회합니다.
 
@@ -226,55 +232,105 @@ async def get_data(
         - 권한 확인
     """
     # 스텁
-    return {
-        "id": data_id,
-        "name": f"Sample Data {data_id}",
-        "value": 42.5,
-        "score": 0.85,
-    }
+    return ORJSONResponse(
+        content={
+            "id": data_id,
+            "name": f"Sample Data {data_id}",
+            "value": 42.5,
+            "score": 0.85,
+        }
+    )
 
 
 @router.get(
     "/data",
-    response_model=dict,
     status_code=status.HTTP_200_OK,
     summary="데이터 목록 조회",
-    description="샘플 데이터 목록을 페이지네이션과 함께 조회합니다.",
+    description="""
+    샘플 데이터 목록을 keyset(커서) 페이지네이션으로 조회합니다.
+
+    `cursor`는 이전 응답의 `next_cursor` 값을 그대로 전달하면 됩니다.
+    `next_cursor`가 null이면 마지막 페이지입니다.
+
+    **NOTE:** `skip`은 deprecated입니다. OFFSET 기반 페이지네이션은 offset에
+    비례하는 비용이 들기 때문에, 커서가 없을 때만 호환용으로 변환됩니다.
+    """,
 )
 async def list_data(
+    cursor: Optional[str] = None,
     pagination: PaginationParams = Depends(get_pagination),
     db: AsyncSession = Depends(get_database_session),
-) -> dict:
+) -> Response:
     """
     데이터 목록을 조회합니다.
 
+    OFFSET 기반(`skip`/`limit`) 대신 keyset 페이지네이션을 사용합니다.
+    OFFSET은 건너뛰는 행 수에 비례해 스캔 비용이 들지만, keyset은
+    `WHERE id > :last_id ORDER BY id LIMIT :n`으로 B-tree 인덱스 탐색
+    한 번이면 되므로 테이블이 커져도 페이지 조회 비용이 일정합니다.
+
     Args:
-        pagination: 페이지네이션 파라미터
+        cursor: 이전 페이지의 next_cursor (base64로 인코딩된 마지막 id)
+        pagination: 페이지네이션 파라미터 (skip은 하위 호환용)
         db: 데이터베이스 세션
 
     Returns:
-        dict: 페이지네이션된 데이터 목록
+        dict: 데이터 목록과 next_cursor
+
+    Raises:
+        HTTPException: 커서 형식이 잘못된 경우
 
     TODO: 실제 구현
-        - Service list 메서드 추가
+        - stmt = (
+              select(SampleDataModel)
+              .where(SampleDataModel.id > last_id)
+              .order_by(SampleDataModel.id)
+              .limit(limit)
+          )
         - 필터링 파라미터 추가
-        - 정렬 기능 추가
     """
-    # 스텁
-    return {
-        "items": [
-            {"id": i, "name": f"Sample Data {i}", "value": 42.5}
-            for i in range(pagination.skip, pagination.skip + min(10, pagination.limit))
-        ],
-        "total": 100,
-        "page": (pagination.skip // pagination.limit) + 1,
-        "page_size": pagination.limit,
-    }
+    # 커서 디코딩: base64(마지막으로 조회한 id)
+    if cursor is not None:
+        try:
+            last_id = int(base64.urlsafe_b64decode(cursor.encode()).decode())
+        except (ValueError, UnicodeDecodeError, binascii.Error):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+    else:
+        # 하위 호환 shim: 커서가 없으면 skip을 마지막 id로 간주하여 변환
+        last_id = pagination.skip
+
+    # 스텁: id가 last_id 이후인 데이터를 limit만큼 반환 (전체 100건 가정)
+    # 루프 불변 계산(limit, 범위 경계)은 comprehension 밖으로 호이스팅합니다.
+    # 실제 구현에서는 .mappings().all() 결과를 그대로 orjson에 넘기세요.
+    total = 100
+    limit = min(10, pagination.limit)
+    start = last_id + 1
+    stop = min(last_id + limit, total) + 1
+    items = [
+        {"id": i, "name": f"Sample Data {i}", "value": 42.5}
+        for i in range(start, stop)
+    ]
+
+    # 다음 페이지 커서 생성 (마지막 페이지면 None)
+    next_cursor = None
+    if items and items[-1]["id"] < total:
+        next_cursor = base64.urlsafe_b64encode(str(items[-1]["id"]).encode()).decode()
+
+    return ORJSONResponse(
+        content={
+            "items": items,
+            "total": total,
+            "page_size": pagination.limit,
+            "next_cursor": next_cursor,
+        }
+    )
 
 
 @router.post(
     "/data",
-    response_model=dict,
     status_code=status.HTTP_201_CREATED,
     summary="데이터 생성",
     description="새로운 샘플 데이터를 생성합니다.",
@@ -282,8 +338,8 @@ async def list_data(
 async def create_data(
     request: dict,
     db: AsyncSession = Depends(get_database_session),
-    current_user: Optional[dict] = Depends(get_optional_current_user),
-) -> dict:
+    current_user: Optional[CurrentUser] = Depends(get_optional_current_user),
+) -> Response:
     """
     새로운 데이터를 생성합니다.
 
@@ -301,17 +357,19 @@ async def create_data(
         - 트랜잭션 처리
     """
     # 스텁
-    return {
-        "id": 999,
-        "name": request.get("name", "New Sample Data"),
-        "value": request.get("value", 0.0),
-        "created_at": "2024-01-01T00:00:00Z",
-    }
+    return ORJSONResponse(
+        content={
+            "id": 999,
+            "name": request.get("name", "New Sample Data"),
+            "value": request.get("value", 0.0),
+            "created_at": "2024-01-01T00:00:00Z",
+        },
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.put(
     "/data/{data_id}",
-    response_model=dict,
     status_code=status.HTTP_200_OK,
     summary="데이터 수정",
     description="기존 샘플 데이터를 수정합니다.",
@@ -320,8 +378,8 @@ async def update_data(
     data_id: int,
     request: dict,
     db: AsyncSession = Depends(get_database_session),
-    current_user: Optional[dict] = Depends(get_optional_current_user),
-) -> dict:
+    current_user: Optional[CurrentUser] = Depends(get_optional_current_user),
+) -> Response:
     """
     데이터를 수정합니다.
 
@@ -340,12 +398,14 @@ async def update_data(
         - 권한 확인
     """
     # 스텁
-    return {
-        "id": data_id,
-        "name": request.get("name", "Updated Sample Data"),
-        "value": request.get("value", 0.0),
-        "updated_at": "2024-01-01T00:00:00Z",
-    }
+    return ORJSONResponse(
+        content={
+            "id": data_id,
+            "name": request.get("name", "Updated Sample Data"),
+            "value": request.get("value", 0.0),
+            "updated_at": "2024-01-01T00:00:00Z",
+        }
+    )
 
 
 @router.delete(
@@ -357,7 +417,7 @@ async def update_data(
 async def delete_data(
     data_id: int,
     db: AsyncSession = Depends(get_database_session),
-    current_user: Optional[dict] = Depends(get_optional_current_user),
+    current_user: Optional[CurrentUser] = Depends(get_optional_current_user),
 ) -> None:
     """
     데이터를 삭제합니다.
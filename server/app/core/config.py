@@ -44,6 +44,10 @@ class Settings(BaseSettings):
         default="development",
         description="실행 환경 (development, staging, production)"
     )
+    VALIDATE_INTERNAL: bool = Field(
+        default=False,
+        description="내부 계층(Calculator 등)의 중복 검증 실행 여부 (핫 패스 비용)"
+    )
 
     # ====================
     # API Settings
@@ -52,6 +56,10 @@ class Settings(BaseSettings):
         default="/api/v1",
         description="API v1 경로 prefix"
     )
+    UVICORN_WORKERS: int = Field(
+        default=1,
+        description="uvicorn 워커 프로세스 수 (reload 모드에서는 1로 강제됨)"
+    )
     ALLOWED_ORIGINS: list[str] = Field(
         default=["http://localhost:3000"],
         description="CORS 허용 오리진"
@@ -24,6 +24,7 @@ engine = create_async_engine(
     echo=settings.DB_ECHO,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=1800,  # 30분마다 연결 재생성 (유휴 연결 끊김 방지)
     pool_pre_ping=True,  # 연결 유효성 자동 검사
 )
 
@@ -89,12 +90,12 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
     Yields:
         AsyncSession: 데이터베이스 세션
+
+    NOTE: `async with`가 세션 정리를 보장하므로 별도의 try/finally로
+          close()를 중복 호출하지 않습니다.
     """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 # ====================
@@ -141,6 +142,29 @@ class DatabaseManager:
         await DatabaseManager.drop_tables()
         await DatabaseManager.create_tables()
 
+    @staticmethod
+    def get_pool_status() -> dict:
+        """
+        커넥션 풀 상태를 반환합니다.
+
+        풀 고갈이나 오버플로우를 모니터링할 때 사용합니다.
+        /core/db-pool 엔드포인트로 노출됩니다.
+
+        Returns:
+            dict: 풀 메트릭
+                - pool_size: 풀 기본 크기
+                - checked_in: 풀에 반납되어 대기 중인 연결 수
+                - checked_out: 현재 사용 중인 연결 수
+                - overflow: 풀 크기를 초과해 생성된 연결 수
+        """
+        pool = engine.pool
+        return {
+            "pool_size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+
     @staticmethod
     async def close_connections() -> None:
         """
@@ -4,7 +4,8 @@ FastAPI 공통 의존성 (Dependencies)
 라우터에서 사용할 수 있는 재사용 가능한 의존성 함수들을 정의합니다.
 """
 
-from typing import Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
 
 from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +13,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from server.app.core.config import settings
 from server.app.core.database import get_db
 
+if TYPE_CHECKING:
+    from server.app.examples.sample_domain.service import SampleDomainService
+
 
 # ====================
 # Database Dependency
@@ -31,6 +35,39 @@ async def get_database_session() -> AsyncSession:
         yield session
 
 
+# ====================
+# Service Dependencies
+# ====================
+
+
+async def get_sample_service(
+    db: AsyncSession = Depends(get_database_session),
+) -> "SampleDomainService":
+    """
+    샘플 도메인 서비스 의존성
+
+    요청마다 서비스 인스턴스를 생성하되, 내부의 stateless Calculator들은
+    모듈 레벨 싱글톤을 재사용하여 요청당 할당 비용을 줄입니다.
+
+    사용법:
+        @router.post("/analyze")
+        async def analyze(
+            service: SampleDomainService = Depends(get_sample_service),
+        ):
+            ...
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        SampleDomainService: 서비스 인스턴스
+    """
+    # core 모듈이 import 시점에 도메인 구현에 의존하지 않도록 지연 import
+    from server.app.examples.sample_domain.service import SampleDomainService
+
+    return SampleDomainService(db)
+
+
 # ====================
 # Authentication Dependencies
 # ====================
@@ -118,6 +155,23 @@ class AuthenticationChecker:
 auth_checker = AuthenticationChecker()
 
 
+@dataclass(slots=True, frozen=True)
+class CurrentUser:
+    """
+    현재 사용자 정보
+
+    인증된 사용자를 나타내는 경량 불변 객체입니다.
+
+    dict 대신 __slots__ 기반 dataclass를 사용하는 이유:
+        - 모든 엔드포인트에서 반복되는 `.get("user_id")` 해시 조회 대신
+          속성 접근을 사용 (CPython 3.11+의 LOAD_ATTR 인라인 캐시 활용)
+        - 인스턴스 footprint가 작고 필드 오타가 AttributeError로 즉시 드러남
+    """
+
+    user_id: Optional[int] = None
+    username: Optional[str] = None
+
+
 # ====================
 # Common Dependencies
 # ====================
@@ -145,7 +199,7 @@ async def get_current_user(
 
 async def get_optional_current_user(
     authorization: Optional[str] = Header(None),
-) -> Optional[dict]:
+) -> Optional[CurrentUser]:
     """
     선택적 인증: 토큰이 있으면 검증하고, 없으면 None 반환
 
@@ -153,9 +207,11 @@ async def get_optional_current_user(
 
     사용법:
         @router.get("/items")
-        async def get_items(user: Optional[dict] = Depends(get_optional_current_user)):
+        async def get_items(
+            user: Optional[CurrentUser] = Depends(get_optional_current_user),
+        ):
             if user:
-                # 인증된 사용자용 로직
+                # 인증된 사용자용 로직 (user.user_id)
             else:
                 # 비인증 사용자용 로직
 
@@ -163,16 +219,21 @@ async def get_optional_current_user(
         authorization: Authorization 헤더
 
     Returns:
-        Optional[dict]: 사용자 정보 또는 None
+        Optional[CurrentUser]: 사용자 정보 또는 None
     """
     if not authorization:
         return None
 
     try:
-        return await auth_checker.verify_token(authorization)
+        user_info = await auth_checker.verify_token(authorization)
     except HTTPException:
         return None
 
+    return CurrentUser(
+        user_id=user_info.get("user_id"),
+        username=user_info.get("username"),
+    )
+
 
 # ====================
 # Pagination Dependencies
@@ -256,7 +317,7 @@ class RequestContext:
 
 
 async def get_request_context(
-    user: Optional[dict] = Depends(get_optional_current_user),
+    user: Optional[CurrentUser] = Depends(get_optional_current_user),
     x_request_id: Optional[str] = Header(None),
     x_forwarded_for: Optional[str] = Header(None),
 ) -> RequestContext:
@@ -278,7 +339,7 @@ async def get_request_context(
     Returns:
         RequestContext: 요청 컨텍스트
     """
-    user_id = user.get("user_id") if user else None
+    user_id = user.user_id if user else None
     client_ip = x_forwarded_for.split(",")[0] if x_forwarded_for else None
 
     return RequestContext(
@@ -0,0 +1,106 @@
+"""
+커스텀 Response 클래스
+
+orjson 기반의 고성능 JSON 직렬화 응답을 정의합니다.
+
+FastAPI 기본 JSONResponse는 `jsonable_encoder`를 거쳐 표준 `json.dumps`로
+직렬화하는데, 응답이 많은 엔드포인트에서는 이 과정이 주요 병목이 됩니다.
+핸들러에서 ORJSONResponse를 직접 반환하면 encoder + response_model 재검증
+단계를 건너뛰어 직렬화 비용을 크게 줄일 수 있습니다.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+import anyio.to_thread
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """
+    orjson이 기본적으로 처리하지 못하는 타입을 변환합니다.
+
+    Args:
+        obj: 직렬화할 수 없는 객체
+
+    Returns:
+        Any: orjson이 직렬화할 수 있는 형태
+
+    Raises:
+        TypeError: 지원하지 않는 타입인 경우
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    orjson 기반 JSON 응답
+
+    사용법:
+        @router.get("/items")
+        async def get_items() -> Response:
+            return ORJSONResponse(content={"items": [...]})
+
+    NOTE: 핸들러에서 Response 객체를 직접 반환하면 FastAPI는
+          response_model 검증과 jsonable_encoder를 건너뜁니다.
+          OpenAPI 문서가 필요하면 `responses={200: {"model": ...}}`로
+          스키마만 등록하세요.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default)
+
+
+class PydanticResponse(Response):
+    """
+    Pydantic 모델 전용 JSON 응답
+
+    직렬화를 워커 스레드에서 수행하여 이벤트 루프를 막지 않습니다.
+
+    단일 워커 프로세스에서 응답 직렬화는 CPU 바운드 작업이므로, 이벤트
+    루프 위에서 실행하면 그 시간 동안 다른 모든 동시 요청이 멈춥니다.
+    `create()`는 `model_dump_json()`을 스레드풀로 넘겨 루프가 계속
+    I/O를 처리할 수 있게 합니다.
+
+    사용법:
+        @router.post("/analyze")
+        async def analyze(...) -> Response:
+            return await PydanticResponse.create(result.data)
+
+    NOTE: 스레드 홉 자체에도 비용이 있어 대략 4KB 이상의 본문에서
+          이득이 커집니다. 직렬화 전에는 본문 크기를 알 수 없으므로
+          일괄 오프로드하며, 아주 작은 응답만 내보내는 엔드포인트라면
+          ORJSONResponse를 직접 반환하는 편이 낫습니다.
+    """
+
+    media_type = "application/json"
+
+    @classmethod
+    async def create(
+        cls,
+        content: BaseModel,
+        status_code: int = 200,
+    ) -> "PydanticResponse":
+        """
+        Pydantic 모델을 워커 스레드에서 직렬화하여 응답을 생성합니다.
+
+        Args:
+            content: 직렬화할 Pydantic 모델
+            status_code: HTTP 상태 코드
+
+        Returns:
+            PydanticResponse: 직렬화된 JSON 응답
+        """
+        body = await anyio.to_thread.run_sync(content.model_dump_json)
+        return cls(content=body.encode("utf-8"), status_code=status_code)
@@ -17,6 +17,7 @@ from typing import Dict, Any
 from fastapi import APIRouter, status
 
 from server.app.core.config import settings
+from server.app.core.database import DatabaseManager
 
 
 # ====================
@@ -106,6 +107,34 @@ class VersionService:
         }
 
 
+# ====================
+# Database Pool Service
+# ====================
+
+class DatabasePoolService:
+    """
+    데이터베이스 커넥션 풀 모니터링 서비스
+
+    커넥션 풀의 사용 현황을 제공합니다.
+    풀 고갈(checked_out이 pool_size + max_overflow에 근접)이나
+    과도한 오버플로우를 조기에 감지할 때 사용합니다.
+
+    확장 가이드:
+        - Prometheus 메트릭으로 내보내기
+        - 임계치 초과 시 알림 연동
+    """
+
+    @staticmethod
+    async def get_pool_status() -> Dict[str, Any]:
+        """
+        커넥션 풀 상태 반환
+
+        Returns:
+            Dict: 풀 메트릭 (pool_size, checked_in, checked_out, overflow)
+        """
+        return DatabaseManager.get_pool_status()
+
+
 # ====================
 # Endpoints
 # ====================
@@ -176,6 +205,36 @@ async def version_info() -> Dict[str, Any]:
     return await service.get_version_info()
 
 
+@router.get(
+    "/db-pool",
+    summary="DB 커넥션 풀 상태",
+    description="""
+    데이터베이스 커넥션 풀의 사용 현황을 반환합니다.
+
+    **사용 사례:**
+    - 풀 고갈 여부 모니터링
+    - pool_size / max_overflow 튜닝 근거 수집
+
+    **응답 필드:**
+    - `pool_size`: 풀 기본 크기
+    - `checked_in`: 반납되어 대기 중인 연결 수
+    - `checked_out`: 현재 사용 중인 연결 수
+    - `overflow`: 풀 크기를 초과해 생성된 연결 수
+    """,
+    response_model=Dict[str, Any],
+    status_code=status.HTTP_200_OK,
+)
+async def db_pool_status() -> Dict[str, Any]:
+    """
+    DB 커넥션 풀 상태 엔드포인트
+
+    Returns:
+        Dict: 풀 메트릭
+    """
+    service = DatabasePoolService()
+    return await service.get_pool_status()
+
+
 # ====================
 # 확장 가이드
 # ====================
@@ -5,9 +5,12 @@ Sample Domain Repositories
 BaseRepository를 상속받아 데이터 소스로부터 데이터를 가져옵니다.
 """
 
-from sqlalchemy import select
+import time
+
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from server.app.core.logging import get_logger
 from server.app.shared.base import BaseRepository
 from server.app.shared.exceptions import NotFoundException, RepositoryException
 from server.app.examples.sample_domain.models import SampleDataModel
@@ -18,6 +21,8 @@ from server.app.examples.sample_domain.schemas import (
     SimpleRepositoryOutput,
 )
 
+logger = get_logger(__name__)
+
 
 class SampleDataRepository(BaseRepository[SampleRepositoryInput, SampleRepositoryOutput]):
     """
@@ -82,7 +87,9 @@ class SampleDataRepository(BaseRepository[SampleRepositoryInput, SampleRepositor
             # )
 
             # 스텁: 더미 데이터 반환
-            return SampleRepositoryOutput(
+            # NOTE: 내부에서 생성한 신뢰할 수 있는 값이므로 model_construct로
+            #       Pydantic 필드 검증을 건너뜁니다. 외부 입력에는 사용 금지.
+            return SampleRepositoryOutput.model_construct(
                 id=input_data.data_id,
                 name=f"Sample Data {input_data.data_id}",
                 value=42.5,
@@ -119,82 +126,102 @@ class SampleDataRepository(BaseRepository[SampleRepositoryInput, SampleRepositor
         """
         여러 데이터를 한 번에 조회합니다.
 
+        ID마다 provide()를 반복 호출하면 라운드 트립이 O(N)으로 늘어나는
+        전형적인 N+1 패턴이므로, 단일 IN 쿼리로 한 번에 조회합니다.
+
         Args:
             data_ids: 조회할 데이터 ID 목록
 
         Returns:
-            list[SampleRepositoryOutput]: 조회된 데이터 목록
-
-        TODO: 실제 구현 예시
-            - IN 쿼리 사용하여 한 번에 조회
-            - N+1 문제 방지
+            list[SampleRepositoryOutput]: 조회된 데이터 목록 (입력 순서 유지,
+                존재하지 않는 ID는 결과에서 제외)
         """
-        # TODO: 실제 구현
-        # stmt = select(SampleDataModel).where(
-        #     SampleDataModel.id.in_(data_ids)
-        # )
-        # result = await self.db.execute(stmt)
-        # data_list = result.scalars().all()
-        # return [
-        #     SampleRepositoryOutput(
-        #         id=data.id,
-        #         name=data.name,
-        #         value=data.value,
-        #         score=data.score,
-        #     )
-        #     for data in data_list
-        # ]
-
-        # 스텁
+        if not data_ids:
+            return []
+
+        # 단일 IN 쿼리로 한 번에 조회 (라운드 트립 O(1))
+        stmt = select(SampleDataModel).where(SampleDataModel.id.in_(data_ids))
+        result = await self.db.execute(stmt)
+        rows = result.scalars().all()
+
+        # 입력 순서를 유지하기 위해 id로 인덱싱
+        by_id = {row.id: row for row in rows}
+
+        missing_ids = [data_id for data_id in data_ids if data_id not in by_id]
+        if missing_ids:
+            logger.warning(
+                f"get_multiple: {len(missing_ids)} id(s) not found: {missing_ids}"
+            )
+
+        # 내부에서 조회한 신뢰할 수 있는 값이므로 model_construct 사용
         return [
-            await self.provide(SampleRepositoryInput(data_id=data_id))
-            for data_id in data_ids
+            SampleRepositoryOutput.model_construct(
+                id=row.id,
+                name=row.name,
+                value=row.value,
+                score=row.score,
+            )
+            for row in (by_id[data_id] for data_id in data_ids if data_id in by_id)
         ]
 
 
+# 집계 결과 캐시 (모듈 레벨)
+# 집계 통계는 요청마다 바뀌지 않으므로 짧은 TTL 동안 재사용합니다.
+# AsyncSession은 요청마다 새로 생성되어 캐시 키로 쓸 수 없으므로,
+# 세션과 무관한 모듈 레벨 (timestamp, value) 쌍으로 캐시합니다.
+_AGGREGATION_CACHE_TTL = 30.0  # 초
+_aggregation_cache: tuple[float, dict] | None = None
+
+
+def invalidate_aggregation_cache() -> None:
+    """집계 캐시를 무효화합니다 (데이터 변경 후 호출)."""
+    global _aggregation_cache
+    _aggregation_cache = None
+
+
 class SampleAggregationRepository(BaseRepository[SampleRepositoryInput, dict]):
     """
     샘플 집계 데이터 제공자
 
-    통계 데이터나 집계 결과를 제공합니다.
-
-    TODO: 실제 집계 쿼리 구현
-        - COUNT, SUM, AVG 등의 집계 함수 사용
-        - GROUP BY를 사용한 그룹별 집계
-        - 성능을 위한 인덱스 활용
+    COUNT/AVG/MIN/MAX를 단일 쿼리(라운드 트립 1회)로 계산하고,
+    결과를 짧은 TTL 동안 캐시하여 반복 요청 시 DB 부하를 줄입니다.
     """
 
     async def provide(self, input_data: SampleRepositoryInput) -> dict:
         """
         집계 데이터를 제공합니다.
 
+        집계 함수를 개별 쿼리로 나누지 않고 하나의 SELECT로 묶어
+        테이블 스캔과 라운드 트립을 1회로 줄입니다.
+
         Returns:
-            dict: 집계 결과
+            dict: 집계 결과 (count, avg_value, min_value, max_value)
         """
-        # TODO: 실제 집계 쿼리 구현
-        # from sqlalchemy import func
-        # stmt = select(
-        #     func.count(SampleDataModel.id).label('count'),
-        #     func.avg(SampleDataModel.value).label('avg_value'),
-        #     func.min(SampleDataModel.value).label('min_value'),
-        #     func.max(SampleDataModel.value).label('max_value'),
-        # )
-        # result = await self.db.execute(stmt)
-        # row = result.one()
-        # return {
-        #     'count': row.count,
-        #     'avg_value': row.avg_value,
-        #     'min_value': row.min_value,
-        #     'max_value': row.max_value,
-        # }
-
-        # 스텁
-        return {
-            "count": 100,
-            "avg_value": 42.5,
-            "min_value": 10.0,
-            "max_value": 95.0,
+        global _aggregation_cache
+
+        # TTL 이내의 캐시가 있으면 DB를 건너뜁니다
+        if _aggregation_cache is not None:
+            cached_at, cached_value = _aggregation_cache
+            if time.monotonic() - cached_at < _AGGREGATION_CACHE_TTL:
+                return cached_value
+
+        stmt = select(
+            func.count(SampleDataModel.id).label("count"),
+            func.avg(SampleDataModel.value).label("avg_value"),
+            func.min(SampleDataModel.value).label("min_value"),
+            func.max(SampleDataModel.value).label("max_value"),
+        )
+        result = await self.db.execute(stmt)
+        row = result.one()
+
+        aggregation = {
+            "count": row.count,
+            "avg_value": row.avg_value,
+            "min_value": row.min_value,
+            "max_value": row.max_value,
         }
+        _aggregation_cache = (time.monotonic(), aggregation)
+        return aggregation
 
 
 # ====================
@@ -8,6 +8,7 @@ Pydantic v2 모델을 사용합니다.
 from datetime import datetime
 from typing import Optional
 
+import msgspec
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -121,7 +122,11 @@ class SampleAnalysisResponse(BaseModel):
     TODO: 실제 분석 결과에 맞게 필드를 수정하세요
     """
 
+    # 서버가 생성하는 응답이므로 불변 + 추가 필드 금지로 고정합니다
     model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
         json_schema_extra={
             "example": {
                 "data_id": 1,
@@ -176,14 +181,28 @@ class SampleAnalysisResponse(BaseModel):
 # Internal Data Transfer Objects
 # ====================
 
+# 내부 DTO 공통 설정
+# frozen=True + extra="forbid"로 __pydantic_extra__ 기계를 끄고
+# 불변 인스턴스를 만들어 생성 비용과 메모리 사용을 줄입니다.
+# 외부 입력을 받는 요청 스키마에는 적용하지 않습니다.
+_INTERNAL_DTO_CONFIG = ConfigDict(
+    frozen=True,
+    extra="forbid",
+    validate_assignment=False,
+)
+
 
 class SampleRepositoryInput(BaseModel):
     """Repository 입력 데이터"""
+    model_config = _INTERNAL_DTO_CONFIG
+
     data_id: int
 
 
 class SampleRepositoryOutput(BaseModel):
     """Repository 출력 데이터"""
+    model_config = _INTERNAL_DTO_CONFIG
+
     id: int
     name: str
     value: float
@@ -196,21 +215,41 @@ SampleProviderOutput = SampleRepositoryOutput
 
 
 class SampleCalculatorInput(BaseModel):
-    """Calculator 입력 데이터"""
-    value: float
-    score: Optional[float] = None
+    """
+    Calculator 입력 데이터
+
+    값 범위 제약은 Field로 선언하여 모델 생성 시점에 검증합니다.
+    계산기 내부의 validate_input은 같은 검증을 반복하지 않도록
+    settings.VALIDATE_INTERNAL/DEBUG에서만 실행됩니다.
+    """
+    model_config = _INTERNAL_DTO_CONFIG
+
+    value: float = Field(ge=0)
+    score: Optional[float] = Field(default=None, ge=0, le=1)
     analysis_type: str
     threshold: Optional[float] = None
+    include_details: bool = False
 
 
-class SampleCalculatorOutput(BaseModel):
-    """Calculator 출력 데이터"""
+class SampleCalculatorOutput(msgspec.Struct, frozen=True):
+    """
+    Calculator 출력 데이터
+
+    순수 내부 DTO(Calculator가 생성하고 Service가 즉시 소비)이므로
+    Pydantic 대신 msgspec.Struct를 사용합니다. C 레벨 구조체라 생성 시
+    필드별 Python 레벨 검증 비용이 없고, 필요하면 msgspec.json.encode로
+    바로 직렬화할 수 있습니다.
+
+    NOTE: API 경계를 넘는 스키마(요청/응답)는 계속 Pydantic을 사용합니다.
+    """
     metrics: dict[str, float]
     insights: list[str]
 
 
 class SampleFormatterInput(BaseModel):
     """Formatter 입력 데이터"""
+    model_config = _INTERNAL_DTO_CONFIG
+
     data_id: int
     analysis_type: str
     metrics: dict[str, float]
@@ -288,12 +327,15 @@ class SampleListResponse(BaseModel):
 
 class SimpleRepositoryInput(BaseModel):
     """Simple Repository 입력"""
+    model_config = _INTERNAL_DTO_CONFIG
+
     # GET 요청이므로 입력 없음 (또는 query params)
-    pass
 
 
 class SimpleRepositoryOutput(BaseModel):
     """Simple Repository 출력 - 원본 데이터"""
+    model_config = _INTERNAL_DTO_CONFIG
+
     items: list[dict]  # Mock 데이터
 
 
@@ -304,16 +346,22 @@ SimpleProviderOutput = SimpleRepositoryOutput
 
 class SimpleCalculatorInput(BaseModel):
     """Simple Calculator 입력"""
+    model_config = _INTERNAL_DTO_CONFIG
+
     items: list[dict]
 
 
 class SimpleCalculatorOutput(BaseModel):
     """Simple Calculator 출력 - 가공된 데이터"""
+    model_config = _INTERNAL_DTO_CONFIG
+
     processed_items: list[dict]
     total_count: int
 
 
 class SimpleFormatterInput(BaseModel):
     """Simple Formatter 입력"""
+    model_config = _INTERNAL_DTO_CONFIG
+
     processed_items: list[dict]
     total_count: int
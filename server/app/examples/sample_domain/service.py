@@ -30,6 +30,7 @@ from server.app.examples.sample_domain.repositories import (
 from server.app.examples.sample_domain.calculators import (
     SampleAnalysisCalculator,
     SimpleMockCalculator,
+    analysis_calculator,
 )
 from server.app.examples.sample_domain.formatters import (
     SampleResponseFormatter,
@@ -59,16 +60,22 @@ class SampleDomainService(BaseService[SampleAnalysisRequest, SampleAnalysisRespo
             raise HTTPException(status_code=400, detail=result.error)
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        calculator: Optional[SampleAnalysisCalculator] = None,
+    ):
         """
         Args:
             db: 데이터베이스 세션
+            calculator: 분석 계산기 (기본값: 모듈 레벨 싱글톤)
         """
         super().__init__(db)
 
-        # 의존성 주입: Repository, Calculator, Formatter 인스턴스 생성
+        # 의존성 주입: Repository는 세션에 바인딩되므로 요청마다 생성하고,
+        # Calculator는 stateless이므로 공유 싱글톤을 재사용합니다.
         self.data_repository = SampleDataRepository(db)
-        self.analysis_calculator = SampleAnalysisCalculator()
+        self.analysis_calculator = calculator or analysis_calculator
         self.response_formatter = SampleResponseFormatter()
 
     async def execute(
@@ -146,8 +153,8 @@ class SampleDomainService(BaseService[SampleAnalysisRequest, SampleAnalysisRespo
             - 캐시 확인
             - 병렬 데이터 조회
         """
-        # Provider 입력 생성
-        provider_input = SampleProviderInput(
+        # Repository 입력 생성
+        provider_input = SampleRepositoryInput(
             data_id=request.data_id
         )
 
@@ -188,6 +195,7 @@ class SampleDomainService(BaseService[SampleAnalysisRequest, SampleAnalysisRespo
             score=data.get("score"),
             analysis_type=request.analysis_type,
             threshold=request.threshold,
+            include_details=request.include_details,
         )
 
         # Calculator 호출